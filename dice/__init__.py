@@ -4,7 +4,6 @@ its methods, without having to init this class inside the program using it.
 """
 
 
-from copy import deepcopy as deepcopy
 import inspect
 from typing import Any
 
@@ -38,18 +37,18 @@ def show_settings() -> None:
 
 
 def change_settings(**kwargs) -> None:
-    """Create a new roller instance with the modified settings."""
+    """Switch to a roller instance with the modified settings."""
     global _ROLLER
     for key_word, value in kwargs.items():
         _SETTINGS[key_word] = value
 
-    _ROLLER = Roller(**_SETTINGS)
+    _ROLLER = Roller.get(**_SETTINGS)
 
 
 def get_roller(**kwargs) -> Roller:
-    """Put in some settings, and get a roller instance back."""
-    settings = deepcopy(_DEFAULT_SETTINGS) | kwargs
-    return Roller(**settings)
+    """Get a roller with some settings, shared unless given an rng (rng only seeds numpy draws)."""
+    settings = {**_DEFAULT_SETTINGS, **kwargs}
+    return Roller.get(**settings)
 
 
 def help() -> None:
@@ -73,8 +72,8 @@ def _get_default_settings() -> dict[str, Any]:
 
 
 _DEFAULT_SETTINGS = _get_default_settings()
-_SETTINGS = deepcopy(_DEFAULT_SETTINGS)
-_ROLLER = Roller()
+_SETTINGS = dict(_DEFAULT_SETTINGS)
+_ROLLER = Roller.get()
 
 _ALL_HELP_TEXT = {"sum": "", "pool": ""}  # Making sure pool/sum are inserted first.
 for _func_name in __ALL__:
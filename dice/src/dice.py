@@ -1,12 +1,65 @@
 """A Module containing some dice rollers."""
 
 
+from collections.abc import Callable
+import heapq
 import random
 import re
-import operator
-from copy import deepcopy
+from functools import partial
 import numpy as np
 
+try:
+    # Optional, a linear time DFA based regex engine. The dice grammar is
+    # simple enough that the builtin re module works just as well.
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+
+# Testing on laptop shows this is the dice count where numpy becomes more
+# efficient than the builtin random module.
+_NUMPY_DICE_COUNT = 20
+
+# The most parsed dice inputs a roller remembers.
+_PARSE_CACHE_SIZE = 512
+
+_DIGITS = "0123456789"
+
+_ADVANTAGE_SYMBOL = "^"
+_DISADVANTAGE_SYMBOL = "v"
+
+# The order the rolling methods take their parameters in.
+_ROLL_PARAMETERS = ("count", "sides", "exploding", "advantage", "target")
+
+# Symbols that are followed by a parameter's digits, used by the scanner.
+_SYMBOL_PARAMETERS = {"d": "sides", "e": "exploding", ">": "target"}
+_END_OF_INPUT = "\0"
+
+# The regex used to parse dice inputs, compiled once at import. Every
+# numeric parameter gets its own named group, so one scan of the input finds
+# all of them. Advantage symbols are simply counted, so they aren't in here.
+_DICE_REGEX = regex_engine.compile(
+    "(?P<count>^\\d+)"
+    "|d(?P<sides>\\d*)"
+    "|e(?P<exploding>\\d*)"
+    "|>(?P<target>\\d*)"
+)
+
+# The numba kernels module, only imported by the first roller that needs it
+# since importing numba takes longer than importing everything else.
+_JIT_KERNELS = None
+
+
+def _get_jit_kernels():
+    """
+    Get the numba kernels module, importing it the first time.
+    """
+    global _JIT_KERNELS
+    if _JIT_KERNELS is None:
+        from dice.src import jit_kernels
+        _JIT_KERNELS = jit_kernels
+    return _JIT_KERNELS
+
 
 class Roller:
     """
@@ -31,171 +84,353 @@ class Roller:
           in case of a conflict, keyword arguments take priority.
         - [exploding] and [advantage/disadvantage] are mutually exclusive,
           rolling with both is not currently supported.
+
+    The rng setting seeds (or shares) the roller's numpy generator, so it only
+    affects numpy draws: the numpy and numba randint methods, pool_batch(), and
+    the bonus dice of exploding numpy rolls. The builtin-randint method, and
+    the auto method for fewer than 20 dice, always draw from python's random
+    module, which rng doesn't touch.
     """
+    # Names of the methods behind each randint and advantage method setting,
+    # shared by every instance and bound at init, and the valid roll methods.
+    _RANDINT_METHODS = {
+        "builtin-randint": "_builtin_randint",
+        "numpy": "_numpy_randint",
+        "numba": "_numba_randint",
+        "auto": "_auto_randint",
+    }
+    _ADVANTAGE_METHODS = {
+        "add-dice": "_add_dice_adv",
+        "roll-all": "_roll_all_adv",
+        "whitehack": "_whitehack_adv",
+    }
+    _ROLL_METHODS = ("roll-over", "roll-under")
+
+    # Plain Rollers handed out by get(), keyed by their settings.
+    _instance_cache = {}
+
+    __slots__ = ("_randint_method", "_rng", "_randint", "_advantage_method",
+                 "_roll_advantage_dice", "_roll_method", "_reverse_on_advantage",
+                 "_parse_cache")
+
     def __init__(self, randint_method="builtin-randint",
-                 advantage_method="add-dice", roll_method="roll-over"):
+                 advantage_method="add-dice", roll_method="roll-over", rng=None):
         # PREFERENCES
         self._randint_method = randint_method
-        self._random_generators = {
-            "builtin-randint": self._builtin_randint,
-            "numpy": self._numpy_randint,
-        }
-
-        advantage_methods = {
-            "add-dice": self._add_dice_adv,
-            "roll-all": self._roll_all_adv,
-            "whitehack": self._whitehack_adv,
-        }
+        # A numpy generator to share, or a seed for a new one. Seeding a new
+        # generator from the OS costs more than most rolls, so programs
+        # making a lot of rollers can hand them all the same one. Only numpy
+        # draws use it, see the class docstring.
+        self._rng = np.random.default_rng(rng)
+        self._randint = getattr(self, self._RANDINT_METHODS[randint_method])
+        if randint_method == "numba":
+            jit_kernels = _get_jit_kernels()
+            if not jit_kernels.NUMBA_AVAILABLE:
+                raise ValueError("The numba randint method needs numba installed")
+            # The kernel draws from numba's own generator, which is global to
+            # the process, so it gets seeded from this roller's generator.
+            # Every numba roller shares that stream, and each new one reseeds it.
+            jit_kernels.seed(int(self._rng.integers(2 ** 32)))
+
         self._advantage_method = advantage_method
-        self._roll_advantage_dice = advantage_methods[advantage_method]
+        self._roll_advantage_dice = getattr(
+            self, self._ADVANTAGE_METHODS[advantage_method])
+        if roll_method not in self._ROLL_METHODS:
+            raise ValueError(f"Invalid roll method: {roll_method}")
         self._roll_method = roll_method
-
-        self._roll_functions = {
-            "advantage": {
-                "add-dice": self._add_dice_adv,
-                "roll-all": self._roll_all_adv,
-                "whitehack": self._whitehack_adv,
-            },
-            "basic-roll": self._basic_roll,
-            "exploding": self._roll_exploding_dice,
-        }
-
-        # CONSTANTS
-        self._advantage_symbol = "^"
-        self._disadvantage_symbol = "v"
-
-        # Generate the regex functions used to parse dice inputs.
-        patterns = {
-            "count": "^\\d+",
-            "sides": "d\\d*",
-            "exploding": "e\\d*",
-            "advantage": f"[//{self._advantage_symbol}{self._disadvantage_symbol}]",
-            "target": ">\\d*",
-        }
-        self._regex_funcs = {}
-        for parameter, pattern in patterns.items():
-            self._regex_funcs[parameter] = re.compile(pattern).findall
-
-        # Functions used to process regex search results for each parameter.
-        self._processing_funcs = {
-            "count": lambda x: int(x[0]),
-            "sides": lambda x: self._extract_int(x[0]),
-            "exploding": lambda x: self._extract_int(x[0]),
-            "advantage": lambda x: self._determine_advantage(x),
-            "target": lambda x: self._extract_int(x[0]),
-        }
-
-        # Needed parameter validation and error raising.
-        self._parameter_value_requirements_and_error_messages = {
-            "sides": (
-                (operator.gt, 0),
-                "sides must be greater than zero: sides = {}",
-            ),
-            "count": (
-                (operator.gt, 0),
-                "count must be greater than zero: count = {}",
-            ),
-            "exploding": (
-                (operator.gt, 1),
-                "exploding value must be greater than 1: exploding = {}"
-            ),
-            "target": (
-                (operator.ne, "should always evaluate to true"),
-                "how did this error happen? There are no invalid target values."
-            ),
-            "advantage": (
-                (operator.ne, 0),
-                "advantage shouldn't be in the dice dict if it's equal to zero"
-            ),
-        }
+        self._reverse_on_advantage = roll_method == "roll-over"
+
+        # Parsed dice are cached per roller, since programs tend to roll the
+        # same handful of dice inputs over and over again.
+        self._parse_cache = {}
+
+    @classmethod
+    def get(cls, randint_method="builtin-randint", advantage_method="add-dice",
+            roll_method="roll-over", rng=None) -> "Roller":
+        """
+        Get a roller with the given settings, only creating one the first
+        time those settings are asked for. Rollers hold nothing but their
+        settings and a parse cache, so it's safe for them to be shared.
+        Rollers given an rng (which only seeds numpy draws) are always new,
+        never shared. Subclasses (like FastRoller) can
+        hold more than that, so this only hands out plain Rollers.
+        """
+        if cls is not Roller:
+            raise TypeError(f"{cls.__name__}.get() isn't supported, create "
+                            f"{cls.__name__} instances directly")
+        # A roller given its own generator (or seed) is never shared or kept,
+        # the caller expects it to start from that generator's state.
+        if rng is not None:
+            return cls(randint_method, advantage_method, roll_method, rng)
+
+        key = (randint_method, advantage_method, roll_method)
+        roller = cls._instance_cache.get(key)
+        if roller is None:
+            roller = cls(randint_method, advantage_method, roll_method)
+            cls._instance_cache[key] = roller
+        return roller
 
     def pool(self, dice_input: str, **kwargs) -> list[int]:
         """
         Roll the dice, get the result as a list.
         """
         dice = self._parse_dice(dice_input, **kwargs)
-        return self._roll(**dice)
+        return self._to_pool(self._roll(**dice), dice)
 
     def sum(self, dice_input: str, **kwargs) -> int:
         """
         Roll the dice then add them all together.
         """
-        return sum(self.pool(dice_input, **kwargs))
+        dice = self._parse_dice(dice_input, **kwargs)
+        if "exploding" in dice:
+            return self._sum_exploding_dice(**dice)
+        return self._total(self._roll(**dice))
+
+    def pool_parsed(self, count: int, sides: int) -> list[int]:
+        """
+        Roll plain dice given their count and sides directly, skipping the
+        dice input parsing altogether.
+        """
+        self._values_are_valid({"count": count, "sides": sides})
+        return self._basic_roll(count, sides)
+
+    def pool_batch(self, count: int, sides) -> np.ndarray:
+        """
+        Roll count plain dice once for every number of sides given, all in
+        a single call to the numpy generator whatever the randint method.
+        The result is an array with one row of dice per entry in sides.
+        """
+        self._values_are_valid({"count": count})
+        sides = np.asarray(sides)
+        # An empty sequence comes out as floats, but there's nothing in it to
+        # truncate.
+        if sides.size and not np.issubdtype(sides.dtype, np.integer):
+            raise ValueError(f"Parameter sides must be int: value={sides}")
+        sides = sides.astype(np.int64, copy=False)
+        if sides.ndim != 1 or (sides <= 0).any():
+            raise ValueError("sides must be a flat sequence of integers greater"
+                             f" than zero: sides = {sides}")
+
+        return self._rng.integers(1, sides[:, None], size=(len(sides), count),
+                                  dtype=np.int64, endpoint=True)
+
+    def compile(self, dice_input: str, **kwargs) -> Callable[[], list[int]]:
+        """
+        Parse the dice once, and get back a function that takes no arguments
+        and rolls them, giving the same kind of result pool() would. Handy
+        for rolling the same dice in a loop without a FastRoller.
+        """
+        pool_dice, _ = self._compile_dice(self._parse_dice(dice_input, **kwargs))
+        return pool_dice
+
+    def _compile_dice(self, dice: dict[str, int]
+                      ) -> tuple[Callable[[], list[int]], Callable[[], int]]:
+        """
+        Get a pool and a sum function for some already parsed dice, neither
+        of which take any arguments.
+        """
+        # The dice never change, so the rolling method and its arguments are
+        # bound together once here, rather than chosen on every roll. Every
+        # rolling method takes its parameters in the same order, so they are
+        # bound as positional arguments, which are cheaper to pass along.
+        args = tuple(dice[parameter] for parameter in _ROLL_PARAMETERS
+                     if parameter in dice)
+        roll_dice = partial(self._get_roll_function(dice), *args)
+        as_list, total = self._as_list, self._total
+
+        # Then pool and sum get closures specialized to the kind of dice
+        # being rolled, so there's nothing left to check on each roll.
+        if "advantage" in dice:
+            def pool_dice():
+                roll = as_list(roll_dice())
+                random.shuffle(roll)  # Unsorting the final result.
+                return roll
+            return pool_dice, lambda: total(roll_dice())
+        elif "exploding" in dice:
+            # Exploding rolls are always lists.
+            return roll_dice, partial(self._sum_exploding_dice, *args)
+        else:
+            return lambda: as_list(roll_dice()), lambda: total(roll_dice())
 
-    def _roll(self, **kwargs) -> list[int]:
+    def _roll(self, **kwargs) -> list[int] | np.ndarray:
         """
         There are actually many different private rolling methods, this method
-        just chooses the appropriate one and passes whatever arguments it
-        needs into the function.
+        just passes whatever arguments it needs into the appropriate one.
         """
-        if "advantage" in kwargs:
-            roll = self._roll_functions["advantage"][self._advantage_method](**kwargs)
-            random.shuffle(roll)  # Unsorting the final result.
-
-        elif "exploding" in kwargs:
-            roll = self._roll_functions["exploding"](**kwargs)
+        return self._get_roll_function(kwargs)(**kwargs)
 
+    def _get_roll_function(self, dice: dict[str, int]) -> Callable:
+        """
+        Choose the private rolling method that can roll the given dice.
+        """
+        if "advantage" in dice:
+            return self._roll_advantage_dice
+        elif "exploding" in dice:
+            return self._roll_exploding_dice
         else:
-            roll = self._roll_functions["basic-roll"](**kwargs)
+            return self._randint
 
+    def _to_pool(self, roll: list[int] | np.ndarray, dice: dict[str, int]
+                 ) -> list[int]:
+        """
+        Turn a roll into the list pool() hands back. Advantage methods sort
+        the dice to pick which ones to keep, so their result gets unsorted
+        here. sum() doesn't care about order, so it skips this step.
+        """
+        roll = self._as_list(roll)
+        if "advantage" in dice:
+            random.shuffle(roll)
         return roll
 
     def _basic_roll(self, count: int, sides: int) -> list[int]:
         """
-        Your most basic roll! All roll methods will end up using this in
-        some way. The random integer method is determined at init.
+        Your most basic roll, the random integer method's dice as a list. The
+        random integer method is determined at init. Rolls that can work on
+        numpy arrays call it directly instead, this is for the ones (like
+        whitehack and the bonus dice of exploding lists) that need a list.
+        """
+        return self._as_list(self._randint(count, sides))
+
+    def _auto_randint(self, count: int, sides: int) -> list[int] | np.ndarray:
+        """
+        Picks the random integer method per roll, the builtin method for a
+        small number of dice and numpy for a large number of dice.
         """
-        return self._random_generators[self._randint_method](count, sides)
+        if count < _NUMPY_DICE_COUNT:
+            return self._builtin_randint(count, sides)
+        return self._numpy_randint(count, sides)
 
     @staticmethod
     def _builtin_randint(count: int, sides: int) -> list[int]:
         """
-        Uses python's builtin random.randint() function.
+        Uses python's builtin random module. random.choices() draws all the
+        dice in one call, rather than calling random.randint() once per die.
         """
-        return [random.randint(1, sides) for _ in range(count)]
+        return random.choices(range(1, sides + 1), k=count)
+
+    def _numpy_randint(self, count: int, sides: int) -> np.ndarray:
+        """
+        Uses numpy's random generator to fill an array in one go.
+        """
+        return self._rng.integers(1, sides + 1, size=count, dtype=np.int64)
 
     @staticmethod
-    def _numpy_randint(count: int, sides: int) -> list[int]:
+    def _numba_randint(count: int, sides: int) -> np.ndarray:
         """
-        Uses numpy's random int array generator.
+        Uses a numba compiled loop. It skips the fixed cost of calling numpy's
+        generator, so it's the quickest way to roll up to a few hundred dice.
+        The dice come from numba's generator, seeded at init.
         """
-        return list(np.random.randint(1, sides, count))
+        return _JIT_KERNELS.randint(count, sides)
 
     def _roll_exploding_dice(self, count: int, sides: int, exploding: int | float
                              ) -> list[int]:
         """
         Roll dice that explode (causing a bonus dice to be rolled) whenever
-        a die meets or exceeds a set value.
-        """
-        roll = self._basic_roll(count, sides)
-        explosion_dice = []
-        for value in roll:
-            if value >= exploding:
-                extra_dice = self._basic_roll(1, sides)
-                while extra_dice[-1] >= exploding:
-                    extra_dice += self._basic_roll(1, sides)
-                explosion_dice += extra_dice
-        return roll + explosion_dice
+        a die meets or exceeds a set value. The bonus dice are rolled in
+        rounds, every die that exploded in the last round gets its bonus die
+        from a single roll, instead of rolling each bonus die one at a time.
+        numpy rolls get all their bonus dice at once from _explode_array.
+        """
+        roll = self._randint(count, sides)
+        if isinstance(roll, np.ndarray):
+            return self._explode_array(roll, sides, exploding).tolist()
+
+        roll = self._as_list(roll)
+        new_dice = roll
+        while explosions := self._count_explosions(new_dice, exploding):
+            new_dice = self._basic_roll(explosions, sides)
+            roll += new_dice
+        return roll
 
-    def _add_dice_adv(self, count: int, sides: int, advantage: int) -> list[int]:
+    def _sum_exploding_dice(self, count: int, sides: int,
+                            exploding: int | float) -> int:
+        """
+        The same as _roll_exploding_dice, but for sum(). Each round is added
+        to a running total straight away, so numpy arrays never need to be
+        turned into lists.
+        """
+        new_dice = self._randint(count, sides)
+        if isinstance(new_dice, np.ndarray):
+            return int(self._explode_array(new_dice, sides, exploding).sum())
+
+        total = self._total(new_dice)
+        while explosions := self._count_explosions(new_dice, exploding):
+            new_dice = self._randint(explosions, sides)
+            total += self._total(new_dice)
+        return total
+
+    def _explode_array(self, roll: np.ndarray, sides: int, exploding: int | float
+                       ) -> np.ndarray:
+        """
+        Add the bonus dice to an exploding numpy roll without going round by
+        round. Every die that explodes starts a chain of bonus dice, where
+        each die explodes again except the last one, so the chain lengths
+        are geometric. We draw the chain lengths, then draw all the bonus
+        dice that explode again from [exploding, sides] and the last die of
+        each chain from [1, exploding - 1].
+        """
+        explosions = int(np.count_nonzero(roll >= exploding))
+        if not explosions:
+            return roll
+        chain_lengths = self._rng.geometric((exploding - 1) / sides,
+                                            size=explosions)
+        exploding_dice = self._rng.integers(
+            exploding, sides + 1, size=int(chain_lengths.sum()) - explosions,
+            dtype=np.int64)
+        last_dice = self._rng.integers(1, exploding, size=explosions,
+                                       dtype=np.int64)
+        return np.concatenate((roll, exploding_dice, last_dice))
+
+    @staticmethod
+    def _count_explosions(roll: list[int] | np.ndarray, exploding: int | float
+                          ) -> int:
         """
-        Advantage implementation where n dice are added, and the highest/lowest
-        n dice are kept.
+        Count the dice in a roll that meet or exceed the exploding value.
         """
-        roll = self._basic_roll(count + (abs_adv := abs(advantage)), sides)
-        reverse = self._is_reversed(advantage)
-        return sorted(roll, reverse=reverse)[:-abs_adv]
+        if isinstance(roll, np.ndarray):
+            return int(np.count_nonzero(roll >= exploding))
+        return sum(value >= exploding for value in roll)
 
-    def _roll_all_adv(self, count: int, sides: int, advantage: int) -> iter:
-        """
-        Advantage implementation where all dice are rolled n times, and list
-        with the greatest/lowest sum is chosen.
+    def _add_dice_adv(self, count: int, sides: int, advantage: int
+                      ) -> list[int] | np.ndarray:
         """
-        rolls = []
-        for _ in range(abs(advantage)):
-            rolls.append(self._basic_roll(count, sides))
-        reverse = self._is_reversed(advantage)
-        return sorted(rolls, key=sum, reverse=reverse)[-1]
+        Advantage implementation where n dice are added, and the highest/lowest
+        n dice are kept. numpy rolls are split with np.partition, which picks
+        the dice to keep in linear time without sorting them.
+        """
+        roll = self._randint(count + (abs_adv := abs(advantage)), sides)
+        keep_highest = self._is_reversed(advantage)
+        if isinstance(roll, np.ndarray):
+            if keep_highest:
+                return np.partition(roll, abs_adv)[abs_adv:]
+            return np.partition(roll, count - 1)[:count]
+
+        if keep_highest:
+            return heapq.nlargest(count, roll)
+        return heapq.nsmallest(count, roll)
+
+    def _roll_all_adv(self, count: int, sides: int, advantage: int
+                      ) -> list[int] | np.ndarray:
+        """
+        Advantage implementation where all dice are rolled n + 1 times, and
+        the set with the greatest/lowest sum is chosen. Every set of dice
+        comes out of a single roll, numpy rolls are summed a row at a time by
+        numpy.
+        """
+        sets = abs(advantage) + 1
+        roll = self._randint(count * sets, sides)
+        keep_highest = self._is_reversed(advantage)
+        if isinstance(roll, np.ndarray):
+            rolls = roll.reshape(sets, count)
+            sums = rolls.sum(axis=1)
+            return rolls[sums.argmax() if keep_highest else sums.argmin()]
+
+        rolls = [roll[index:index + count]
+                 for index in range(0, len(roll), count)]
+        if keep_highest:
+            return max(rolls, key=sum)
+        return min(rolls, key=sum)
 
     def _whitehack_adv(self, count: int, sides: int, advantage: int,
                        target: int) -> list[int]:
@@ -231,48 +466,69 @@ class Roller:
         Or, in other words, deciding whether we're keeping the highest
         values or the lowest values.
         """
-        # Two variables, each with two possible values, so four cases total.
-        # Note also: reverse=True means the highest values will be first
-        #            reverse=False means the lowest values will be first
-        if ((advantage > 0 and self._roll_method == "roll-over")
-                or
-            (advantage < 0 and self._roll_method == "roll-under")):
-            # We have advantage and we want to roll high. (we get what we want)
-            # or
-            # We have disadvantage and we want to roll low. (we don't get what we want)
-            return True
-        elif advantage == 0:
-            raise ValueError("You should not be running this method if"
-                             " advantage=0")
-        else:
-            # We have advantage and we want to roll low. (we get what we want)
-            # We have disadvantage and we want to roll high. (we don't get what we want)
-            return False
+        # Note: reverse=True means the highest values will be first
+        #       reverse=False means the lowest values will be first
+        # We keep the highest values if we have advantage and we want to roll
+        # high (we get what we want), or if we have disadvantage and we want
+        # to roll low (we don't get what we want). The roll method part of
+        # that is worked out once at init. Advantage is never zero here,
+        # _parse_dice drops it from the dice dict when it is.
+        return (advantage > 0) == self._reverse_on_advantage
 
     def _parse_dice(self, dice_input: str, **kwargs) -> dict[str, int]:
         """
-        Extract information from a dice-string input.
-        """
-        # First we do a regex search for each parameter.
-        search_results = {}
-        for parameter, findall in self._regex_funcs.items():
-            search_results[parameter] = findall(dice_input.casefold())
+        Extract information from a dice-string input. Results are memoized,
+        keyed by the lowercased dice input and the key word arguments, so
+        '1D20' and '1d20' share a cache entry. The same dice dict is handed
+        out on every cache hit, so it must never be mutated.
+        """
+        # Dice strings are ASCII, so lower() does all casefold() would, and
+        # most inputs are already lowercase so even that copy can be skipped.
+        if not dice_input.islower():
+            dice_input = dice_input.lower()
+        if not kwargs:
+            key = dice_input
+        elif all(isinstance(value, int) for value in kwargs.values()):
+            key = (dice_input, frozenset(kwargs.items()))
+        else:
+            # Arguments that aren't ints can't be cached (6.0 would share 6's
+            # entry, lists can't be hashed), and are left to _values_are_valid
+            # to reject.
+            return self._parse_dice_uncached(dice_input, kwargs)
+        dice = self._parse_cache.get(key)
+        if dice is None:
+            dice = self._parse_dice_uncached(dice_input, kwargs)
+            if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+                # Dicts remember insertion order, so this evicts the oldest.
+                del self._parse_cache[next(iter(self._parse_cache))]
+            self._parse_cache[key] = dice
+        return dice
 
+    def _parse_dice_uncached(self, dice_input: str, kwargs: dict[str, int]
+                             ) -> dict[str, int]:
+        """
+        Does the actual parsing for _parse_dice, dice_input must already be
+        lowercase.
+        """
         # Here we add any dice arguments we got from key word arguments.
-        # then we take whatever results (if any) from dice_input and process
-        # the results with each one's dedicated processing function.
-        dice = deepcopy(kwargs)
+        dice = dict(kwargs)
         self._convert_disadvantage(dice)
-        for parameter, results in search_results.items():
-            func = self._processing_funcs[parameter]
-
-            # Run the processing func on any non-empty search.
-            # Also, we explicitly make sure dice_input results don't overwrite
-            # anything passed in as a key world argument.
-            if results and parameter not in kwargs:
-                dice[parameter] = func(results)
-
 
+        # Then we find each parameter's digits in dice_input, along with the
+        # total advantage. The hand written scanner handles well formed
+        # inputs, anything unusual is left to the regex.
+        search = self._scan_dice(dice_input)
+        if search is None:
+            search = self._search_dice(dice_input)
+        search_results, advantage = search
+
+        # We explicitly make sure dice_input results don't overwrite
+        # anything passed in as a key word argument.
+        for parameter, digits in search_results.items():
+            if parameter not in dice:
+                dice[parameter] = int(digits)
+        if advantage and "advantage" not in dice:
+            dice["advantage"] = advantage
 
         # Then we handle some exceptional situations.
         if "count" not in dice: dice["count"] = 1  # Only parameter with a default value.
@@ -283,22 +539,85 @@ class Roller:
 
         return dice
 
+    @staticmethod
+    def _scan_dice(dice_input: str) -> tuple[dict[str, str], int] | None:
+        """
+        Walk through dice_input one character at a time. Digits belong to
+        the parameter of the last symbol seen ('d', 'e' or '>'), or to count
+        if they come first, and advantage symbols are tallied as they come.
+        Returns None if the input does anything the regex would treat
+        differently, like repeating a parameter, having digits after an
+        advantage symbol, or containing any other character.
+        """
+        search_results = {}
+        advantage = 0
+        parameter = "count"
+        start = 0
+        for index, char in enumerate(dice_input + _END_OF_INPUT):
+            if char in _DIGITS:
+                continue
+
+            # Close off the digits of the current parameter.
+            if parameter is None:
+                if index > start:
+                    return None
+            elif parameter in search_results:
+                return None
+            elif index > start or parameter != "count":
+                search_results[parameter] = dice_input[start:index]
+
+            start = index + 1
+            if char == _ADVANTAGE_SYMBOL:
+                advantage += 1
+                parameter = None
+            elif char == _DISADVANTAGE_SYMBOL:
+                advantage -= 1
+                parameter = None
+            elif char in _SYMBOL_PARAMETERS:
+                parameter = _SYMBOL_PARAMETERS[char]
+            elif char != _END_OF_INPUT:
+                return None
+
+        return search_results, advantage
+
+    @staticmethod
+    def _search_dice(dice_input: str) -> tuple[dict[str, str], int]:
+        """
+        Scan dice_input with the dice regex, taking the first match for each
+        parameter. The advantage symbols can't be part of any other
+        parameter, so they're just counted over the whole input.
+        """
+        search_results = {}
+        for match in _DICE_REGEX.finditer(dice_input):
+            parameter = match.lastgroup
+            if parameter not in search_results:
+                search_results[parameter] = match.group(parameter)
+        advantage = (dice_input.count(_ADVANTAGE_SYMBOL)
+                     - dice_input.count(_DISADVANTAGE_SYMBOL))
+        return search_results, advantage
+
     def _values_are_valid(self, dice: dict[str, int]) -> None:
         """
         Makes sure all parameters are integers, that the integer values are
         within certain bounds depending on the parameter, along with other checks.
         """
-        # First we make sure each parameter's value is an integer, and the
-        # integer passes an inequality, if not, raise an exception and show an
-        # error message.
-        req_and_error = self._parameter_value_requirements_and_error_messages
+        # First we make sure each parameter's value is an integer.
         for parameter, value in dice.items():
+            if parameter not in _ROLL_PARAMETERS:
+                raise ValueError(f"Invalid parameter: {parameter}")
             if not isinstance(value, int):
                 raise ValueError(f"Parameter {parameter} must be int: {value=}")
 
-            (oper, req), error_msg = req_and_error[parameter]
-            if not oper(value, req):
-                raise ValueError(error_msg.format(value))
+        # Then that the integers are within bounds, if not, raise an exception
+        # and show an error message. Target can be any integer, and advantage
+        # is never zero since _parse_dice drops it from the dice dict.
+        if dice["count"] <= 0:
+            raise ValueError(f"count must be greater than zero: count = {dice['count']}")
+        if "sides" in dice and dice["sides"] <= 0:
+            raise ValueError(f"sides must be greater than zero: sides = {dice['sides']}")
+        if "exploding" in dice and dice["exploding"] <= 1:
+            raise ValueError("exploding value must be greater than 1: "
+                             f"exploding = {dice['exploding']}")
 
         # Then we make sure we aren't rolling exploding advantage dice.
         if "exploding" in dice and "advantage" in dice:
@@ -311,30 +630,23 @@ class Roller:
                              " specify a target.")
 
     @staticmethod
-    def _extract_int(substring: str) -> int:
+    def _as_list(roll: list[int] | np.ndarray) -> list[int]:
         """
-        Extracts all numerical characters, in the order they appear, then
-        concatenates and runs the int() function.
+        Turn a roll into a list of python ints, arrays are converted in a
+        single C loop by tolist().
         """
-        regex = re.compile("\\d")
-        search = regex.findall(substring)
-        return int("".join(search))
+        if isinstance(roll, np.ndarray):
+            return roll.tolist()
+        return roll
 
-    def _determine_advantage(self, search_result: list[str]) -> int:
+    @staticmethod
+    def _total(roll: list[int] | np.ndarray) -> int:
         """
-        Count the advantage and disadvantage symbols present in the search
-        result, subtract the number of advantage symbols from the number of
-        disadvantage symbols and return the resulting int.
+        Add up a roll, arrays are summed by numpy without ever making a list.
         """
-        advantage = 0
-        for symbol in search_result:
-            if symbol == self._advantage_symbol:
-                advantage += 1
-            elif symbol == self._disadvantage_symbol:
-                advantage -= 1
-            else:
-                raise ValueError(f"Invalid symbol: {symbol}")
-        return advantage
+        if isinstance(roll, np.ndarray):
+            return int(roll.sum())
+        return sum(roll)
 
     @staticmethod
     def _convert_disadvantage(dice_dict: dict[str, int]):
@@ -353,37 +665,64 @@ class FastRoller(Roller):
     programs that would loop a large number of times, rolling the same type of
     dice repeatedly. Going through the parsing phase every time would be
     wasteful. I wonder if it'll be a lot faster?
+
+    If no randint method is given, numpy is used for 20 or more dice, and the
+    builtin random module is used otherwise.
     """
-    def __init__(self, dice_input, *, randint_method=None, advantage_method=None):
-        if self._get_dice_count(dice_input) >= 20:  # Testing on laptop shows this is the point
-            randint_method = "numpy"                # where it becomes more efficient than the
-                                                    # builtin method.
+    __slots__ = ("_dice", "_pool_dice", "_sum_dice")
+
+    def __init__(self, dice_input, *, randint_method=None,
+                 advantage_method="add-dice", roll_method="roll-over", rng=None):
+        if randint_method is None:
+            if self._get_dice_count(dice_input) >= _NUMPY_DICE_COUNT:
+                randint_method = "numpy"
+            else:
+                randint_method = "builtin-randint"
         super().__init__(randint_method=randint_method,
-                         advantage_method=advantage_method)
+                         advantage_method=advantage_method,
+                         roll_method=roll_method, rng=rng)
         self._dice = self._parse_dice(dice_input)
+        self._pool_dice, self._sum_dice = self._compile_dice(self._dice)
+
+    @classmethod
+    def batch(cls, dice_inputs, **settings) -> list["FastRoller"]:
+        """
+        Get a roller for every dice input, all with the same settings. Each
+        distinct input is only parsed (and given a roller) once, so repeated
+        inputs share a roller. Unless one is given, the rollers also share a
+        single numpy generator.
+        """
+        if settings.get("rng") is None:
+            settings["rng"] = np.random.default_rng()
+        rollers, batch = {}, []
+        for dice_input in dice_inputs:
+            roller = rollers.get(dice_input)
+            if roller is None:
+                roller = rollers[dice_input] = cls(dice_input, **settings)
+            batch.append(roller)
+        return batch
 
-    def pool(self) -> list:
+    def pool(self) -> list[int]:
         """
         Roll the dice, get the result as a list. Takes no arguments.
         """
-        return self._roll(**self._dice)
+        return self._pool_dice()
 
     def sum(self) -> int:
         """
         Roll the dice then add them all together. Takes no arguments.
         """
-        return sum(self._roll(**self._dice))
+        return self._sum_dice()
 
     @staticmethod
     def _get_dice_count(dice_input: str) -> int:
         """
         Get the dice count from dice input. This is dumber than parse
-        dice, if it finds no match it assumes there is only one die.
+        dice, if it finds no leading digits it assumes there is only one die.
         """
-        match = re.compile("^\\d+").search(dice_input)
-        if match is None:
+        digit_count = len(dice_input) - len(dice_input.lstrip(_DIGITS))
+        if digit_count == 0:
             return 1
         else:
-            slc = slice(*match.span())
-            return int(dice_input[slc])
+            return int(dice_input[:digit_count])
 
@@ -0,0 +1,35 @@
+"""
+Numba compiled kernels for the dice rollers. Numba is an optional
+dependency, if it isn't installed NUMBA_AVAILABLE is False and the kernels
+aren't defined.
+"""
+
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def randint(count: int, sides: int) -> np.ndarray:
+        """
+        Roll count dice one at a time in a compiled loop. Dice are drawn from
+        numba's own random generator, not python's or numpy's.
+        """
+        roll = np.empty(count, dtype=np.int64)
+        for index in range(count):
+            roll[index] = np.random.randint(1, sides + 1)
+        return roll
+
+    @njit(cache=True)
+    def seed(value: int) -> None:
+        """
+        Seed numba's own random generator, the one randint() draws from.
+        """
+        np.random.seed(value)
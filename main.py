@@ -8,7 +8,7 @@ import src.tests as tests
 def main():
     args = parse_arguments()
     if args.test == "random-input":
-        tests.random_input(args.trials, args.suppress_print)
+        tests.random_input(args.trials, args.suppress_print, args.processes)
     else:
         raise Exception(f"Invalid test: {args.test}")
 
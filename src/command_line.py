@@ -16,6 +16,12 @@ _SUPPRESS_PRINT_ARGs = {
     "help": "Suppress most messages; intended for running a large number of trials",
     "action": "store_true",
 }
+_PROCESSES_NAME = ["-p", "--processes"]
+_PROCESSES_ARGS = {
+    "help": "Number of processes to spread the trials over when printing is suppressed",
+    "type": int,
+    "default": 1,
+}
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -50,5 +56,6 @@ def _add_random_input_parser(subparsers) -> None:
         help="Run the dice roller with random inputs."
     )
     parser.add_argument(*_SUPPRESS_PRINT_NAME, **_SUPPRESS_PRINT_ARGs)
+    parser.add_argument(*_PROCESSES_NAME, **_PROCESSES_ARGS)
     parser.add_argument(**_TRIALS_ARG)
 
@@ -3,22 +3,27 @@ Functions to get, set, and save the state of the python builtin randomizer.
 """
 
 
+import pickle
 import random
-import shelve
 from datetime import datetime
 
 
-_SHELF_NAME = "saved random states"
+_STATES_FILE = "saved_random_states.pkl"
 
+# Every state in the states file, read the first time it's needed and kept
+# in step with the file by save() afterwards. This assumes nothing else is
+# writing to the file at the same time.
+_STATES_CACHE = None
 
-def get():
+
+def get_state():
     """
     Get the current state of python's built-in random module.
     """
     return random.getstate()
 
 
-def set(state=None) -> None:
+def set_state(state=None) -> None:
     """
     Set the state to a given state, or (if inputting nothing), allow it to
     simply set a random seed.
@@ -33,29 +38,37 @@ def set(state=None) -> None:
 
 def save(state=None) -> None:
     """
-    Save the random state to a shelf. If no arguments are passed it uses
-    the current state.
+    Save the random state to the states file. If no arguments are passed it
+    uses the current state. States are appended to the end of the file, so
+    nothing already saved has to be rewritten.
     """
     if not state: state = random.getstate()
-    with shelve.open(_SHELF_NAME) as db:
-        key = str(len(db))
-        db[key] = ((time := datetime.now()), state)
+    states = _get_states()
+    key = str(len(states))
+    entry = ((time := datetime.now()), state)
+    with open(_STATES_FILE, "ab") as file:
+        pickle.dump(entry, file)
+    states.append(entry)
     print(f"Saved random state #{key} at time {time}")
 
 
-def load(key=None, set_state=True):
+def load(key=None, apply=True):
     """
-    Given the key, load the associated state from the shelF. Given no key,
-    just load the last one. By default this sets the global random state to
-    the loaded state.
+    Given the key (as numbered by show()), load the associated state from
+    the states file. Given no key, just load the last one. Unless apply is False, this also sets the
+    global random state to the loaded state.
     """
-    with shelve.open(_SHELF_NAME) as db:
-        if (size := len(db)) == 0: raise Exception("Cannot load from empty shelf")
-        if not key: key = str(size - 1)
+    states = _get_states()
+    if (size := len(states)) == 0: raise Exception("Cannot load from empty states file")
+    if key is None: key = str(size - 1)
 
-        time, state = db[key]
+    # Keys are the numbers show() lists, so anything else (like '-1', which
+    # int() would happily take as the last state) isn't a key.
+    key = str(key)
+    if key not in map(str, range(size)): raise KeyError(key)
+    time, state = states[int(key)]
 
-    if set_state:
+    if apply:
         random.setstate(state)
         print(f"Loaded random state #{key}, created at {time}")
 
@@ -67,7 +80,33 @@ def show():
     Show all random states currently saved.
     """
     display = ""
-    with shelve.open(_SHELF_NAME) as db:
-        for key, (time, _) in db.items():
-            display += f"{key} -> State saved at {time}\n"
+    for key, (time, _) in enumerate(_get_states()):
+        display += f"{key} -> State saved at {time}\n"
     print(display)
+
+
+def _get_states() -> list:
+    """
+    Get the list of saved (time, state) pairs, only reading the states file
+    the first time.
+    """
+    global _STATES_CACHE
+    if _STATES_CACHE is None:
+        _STATES_CACHE = list(_read_states())
+    return _STATES_CACHE
+
+
+def _read_states():
+    """
+    Read every saved (time, state) pair from the states file, oldest first.
+    The file is a sequence of pickles, so they're unpickled one at a time.
+    """
+    try:
+        with open(_STATES_FILE, "rb") as file:
+            while True:
+                try:
+                    yield pickle.load(file)
+                except EOFError:
+                    return
+    except FileNotFoundError:
+        return
@@ -3,7 +3,25 @@ Random functions usable in various dice input tests.
 """
 
 
-import random
+from collections.abc import Iterator
+import numpy as np
+
+
+_STR_FORMS = {
+    "count": lambda x: "{}".format(x),
+    "sides": lambda x: "{}".format(x),
+    "exploding": lambda x: "e{}".format(x),
+    "advantage": lambda x: "^" * x,
+    "disadvantage": lambda x: "v" * x,
+    "target": lambda x: ">{}".format(x)
+}
+_STR_INPUT_TEMPLATE = "{count}d{sides}{exploding}{advantage}{disadvantage}{target}"
+_STR_INPUT_TEMPLATE_FIELDS = ("count", "sides", "exploding", "advantage",
+                              "disadvantage", "target")
+
+# dice_inputs() draws its random values this many inputs at a time, so it
+# only ever holds one block of them no matter how many trials are asked for.
+_INPUT_BLOCK_SIZE = 8192
 
 
 def dice_input(string_only=False, kwargs_only=False,
@@ -12,75 +30,69 @@ def dice_input(string_only=False, kwargs_only=False,
     """
     Get a random input for the dice function.
     """
-    str_forms = {
-        "count": lambda x: "{}".format(x),
-        "sides": lambda x: "{}".format(x),
-        "exploding": lambda x: "e{}".format(x),
-        "advantage": lambda x: "^" * x,
-        "disadvantage": lambda x: "v" * x,
-        "target": lambda x: ">{}".format(x)
-    }
-    if no_exploding:
-        del str_forms["exploding"]
-    if no_advantage:
-        del str_forms["advantage"]
-        del str_forms["disadvantage"]
-    parameter_names = list(str_forms.keys())
-
-    # Get parameter values and forms.
-    values = _get_parameter_values(parameter_names)
-    name_count = len(parameter_names)
-    parameters = {}
-    for index in range(name_count):
-        name = parameter_names[index]
-        form = _get_parameter_form(string_only=string_only, kwargs_only=kwargs_only)
-        value = values[index]
-        parameters[name] = (form, value)
-
-    # Build dice inputs.
-    str_input = "{}d{}{}{}{}{}"
-    kwarg_inputs = {}
-    for name, (form, value) in parameters.items():
-        if form == "str" and value is not None:
-            str_input = str_input.replace("{}", str_forms[name](value), 1)
-
-        elif form == "kwarg" and value is not None:
-            str_input = str_input.replace("{}", "", 1)
-            kwarg_inputs[name] = value
-
-        else:
-            str_input = str_input.replace("{}", "", 1)
+    return next(_dice_input_block(np.random.default_rng(), 1, string_only,
+                                  kwargs_only, no_exploding, no_advantage))
 
-    return str_input, kwarg_inputs
 
-
-def _get_parameter_form(string_only=False, kwargs_only=False) -> str:
+def dice_inputs(trials: int, string_only=False, kwargs_only=False,
+                no_exploding=False, no_advantage=False,
+                ) -> Iterator[tuple[str, dict[str, int]]]:
     """
-    Randomly determines whether a parameter will be in the dice input or a kwarg.
+    Get a number of random inputs for the dice function. Works like calling
+    dice_input() once per trial, except the random values are drawn a block
+    at a time in a handful of numpy calls rather than one at a time.
     """
-    if string_only:
-        return "str"
-    elif kwargs_only:
-        return "kwarg"
-    else:
-        return random.choice(["str", "kwarg"])
+    rng = np.random.default_rng()
+    for start in range(0, trials, _INPUT_BLOCK_SIZE):
+        size = min(_INPUT_BLOCK_SIZE, trials - start)
+        yield from _dice_input_block(rng, size, string_only, kwargs_only,
+                                     no_exploding, no_advantage)
 
 
-def _get_parameter_values(parameter_names: list[str]) -> list[int | None]:
+def _dice_input_block(rng: np.random.Generator, size: int, string_only: bool,
+                      kwargs_only: bool, no_exploding: bool, no_advantage: bool,
+                      ) -> Iterator[tuple[str, dict[str, int]]]:
     """
-    Given a parameter's name, get a random parameter value.
+    Draw the values for a block of random inputs all at once, then build
+    the inputs from them one by one.
     """
-    exploding = random.choice([True, False])
-    values = {
-        "count": random.randint(1, 100),
-        "sides": (sides := random.randint(2, 1000)),
-        "exploding": random.randint(2, sides) if exploding else None,
-        "advantage": random.randint(0, 10) if not exploding else None,
-        "disadvantage": random.randint(0, 10) if not exploding else None,
-        "target": None,
-    }
-    try:
-        return [val for val in values.values()]
-    except KeyError:
-        raise ValueError(f"Invalid parameter name: {parameter_names}")
+    parameter_names = list(_STR_FORMS.keys())
+
+    # Draw every parameter value for the whole block in one go. The exploding
+    # values are drawn against each input's own number of sides.
+    sides = rng.integers(2, 1000, size, endpoint=True)
+    exploding = rng.integers(2, sides, endpoint=True)
+    if no_exploding:
+        is_exploding = np.zeros(size, dtype=bool)
+    else:
+        is_exploding = rng.integers(2, size=size).astype(bool)
+    has_advantage = ~is_exploding & (not no_advantage)
+    columns = (
+        rng.integers(1, 100, size, endpoint=True),
+        sides,
+        np.where(is_exploding, exploding, -1),
+        np.where(has_advantage, rng.integers(0, 10, size, endpoint=True), -1),
+        np.where(has_advantage, rng.integers(0, 10, size, endpoint=True), -1),
+        np.full(size, -1),
+    )
+    # Likewise every input's choice of str or kwarg for each parameter.
+    if string_only or kwargs_only:
+        in_str = np.full((size, len(parameter_names)), string_only)
+    else:
+        in_str = rng.integers(2, size=(size, len(parameter_names))).astype(bool)
+
+    # Build dice inputs, same as dice_input(). Negative values stand in for
+    # the parameters that are left out.
+    rows = zip(*(column.tolist() for column in columns))
+    for values, forms in zip(rows, in_str.tolist()):
+        str_parts = dict.fromkeys(_STR_INPUT_TEMPLATE_FIELDS, "")
+        kwarg_inputs = {}
+        for name, value, form in zip(parameter_names, values, forms):
+            if value < 0:
+                continue
+            if form:
+                str_parts[name] = _STR_FORMS[name](value)
+            else:
+                kwarg_inputs[name] = value
 
+        yield _STR_INPUT_TEMPLATE.format_map(str_parts), kwarg_inputs
@@ -4,43 +4,138 @@ Try out a bunch of random inputs.
 
 
 from rich.progress import Progress
+import multiprocessing
+import random
 import traceback
 import dice
 import src.randomize as rnd
 import src.random_state as rnd_state
 
 
-def random_input(trials: int, suppress_print: bool) -> None:
+# Getting the random module's state costs more than most rolls, so it's only
+# checkpointed once every this many inputs.
+_CHECKPOINT_INTERVAL = 1024
+
+# Rich takes a lock and works out the bar's rate on every update, so the
+# progress bar only gets moved along once every this many trials.
+_PROGRESS_INTERVAL = 1024
+
+# Only this many of the innermost frames of a failure's traceback get shown.
+_TRACEBACK_LIMIT = 10
+
+# How many trials a worker process gets handed at a time.
+_CHUNK_SIZE = 8 * _CHECKPOINT_INTERVAL
+
+
+def random_input(trials: int, suppress_print: bool, processes: int = 1) -> None:
     """
     Do any number of random inputs, either to mass test and hunt for
-    exceptions, or to just view inputs and outputs.
+    exceptions, or to just view inputs and outputs. With printing suppressed
+    the trials can be spread over several processes.
     """
+    if suppress_print and processes > 1:
+        _parallel_random_input(trials, processes)
+        return
+
+    inputs = _with_checkpoints(rnd.dice_inputs(trials))
+
+    # Each input gets printed when printing isn't suppressed, so there's no
+    # need for a progress bar (or the thread rich renders it with).
+    if not suppress_print:
+        for (dice_str, dice_kwargs), checkpoint in inputs:
+            encountered_error = _execute_random_input(dice_str, dice_kwargs,
+                                                      checkpoint, False)
+            if encountered_error: break
+        return
+
     with Progress() as progress:
-        if suppress_print:
-            task = progress.add_task("Rolling dice...", total=trials)
-        for _ in range(trials):
-            encountered_error = _execute_random_input(suppress_print)
+        task = progress.add_task("Rolling dice...", total=trials)
+        for index, ((dice_str, dice_kwargs), checkpoint) in enumerate(inputs, 1):
+            encountered_error = _execute_random_input(dice_str, dice_kwargs,
+                                                      checkpoint, True)
             if encountered_error: break
-            if suppress_print: progress.advance(task)
+            if index % _PROGRESS_INTERVAL == 0:
+                progress.advance(task, _PROGRESS_INTERVAL)
+        else:
+            progress.update(task, completed=trials)
 
 
-def _execute_random_input(suppress_print: bool) -> bool:
+def _parallel_random_input(trials: int, processes: int) -> None:
+    """
+    Split the trials into chunks and have a pool of worker processes run
+    them. The first failure any worker runs into gets reported, then the
+    rest of the workers are stopped.
     """
-    Execute a single random dice roll with the help of the input randomizer.
+    chunks = [_CHUNK_SIZE] * (trials // _CHUNK_SIZE)
+    if trials % _CHUNK_SIZE:
+        chunks.append(trials % _CHUNK_SIZE)
+
+    # Forked workers start with copies of this process's random state, so
+    # each one reseeds itself to roll different dice. The workers are forked
+    # before the progress bar starts its render thread, since forking while
+    # another thread holds a lock can leave that lock held in the workers.
+    with (multiprocessing.Pool(processes, initializer=random.seed) as pool,
+          Progress() as progress):
+        task = progress.add_task("Rolling dice...", total=trials)
+        for chunk_trials, failure in pool.imap_unordered(_random_input_worker,
+                                                         chunks):
+            if failure is not None:
+                _report_failure(*failure)
+                break
+            progress.advance(task, chunk_trials)
+
+
+def _random_input_worker(trials: int) -> tuple[int, tuple | None]:
+    """
+    Quietly run a chunk of trials in a worker process. Gives back the number
+    of trials along with everything _report_failure() needs if one failed,
+    since the failure has to be reported by the main process.
+    """
+    for (dice_str, dice_kwargs), checkpoint in _with_checkpoints(
+            rnd.dice_inputs(trials)):
+        try:
+            sum(dice.pool(dice_str, **dice_kwargs))
+        except Exception as exc:
+            return trials, (dice_str, dice_kwargs, _recreate_state(checkpoint),
+                            _format_exception(exc))
+    return trials, None
+
+
+def _with_checkpoints(inputs):
+    """
+    Pair each input with the last checkpoint, which is the random module's
+    state at the time along with every input rolled since. An input only
+    gets added to the checkpoint once it's been rolled without any trouble.
+    """
+    for index, dice_input in enumerate(inputs):
+        if index % _CHECKPOINT_INTERVAL == 0:
+            checkpoint = (rnd_state.get_state(), [])
+        yield dice_input, checkpoint
+        checkpoint[1].append(dice_input)
+
+
+def _recreate_state(checkpoint) -> tuple:
+    """
+    Get the random module's state from right before the roll that came
+    after a checkpoint's inputs, by rolling all of them again.
+    """
+    state, rolled_inputs = checkpoint
+    random.setstate(state)
+    for dice_str, dice_kwargs in rolled_inputs:
+        dice.pool(dice_str, **dice_kwargs)
+    return rnd_state.get_state()
+
+
+def _execute_random_input(dice_str: str, dice_kwargs: dict[str, int],
+                          checkpoint, suppress_print: bool) -> bool:
+    """
+    Execute a single dice roll with an input from the input randomizer.
     Prints the outcome to stdout if printing isn't suppressed, and if an
     exception of any kind occurs it will force a print of the last input, and
     will also pickle the python built-in random state at the time of the
-    input.
+    input, recreated from the last checkpoint.
     """
-    # Create random inputs, then save the state of the random module before
-    # the roll.
-    dice_str, dice_kwargs = rnd.dice_input()
-    state = rnd_state.get()
-
-    if not suppress_print:
-        print(f"Input: {dice_str}")
-        for key, value in dice_kwargs.items():
-            print(f" -    {key}: {value}")
+    if not suppress_print: print(_format_input("Input", dice_str, dice_kwargs))
 
     try:
         roll = dice.pool(dice_str, **dice_kwargs)
@@ -49,15 +144,41 @@ def _execute_random_input(suppress_print: bool) -> bool:
         # If any exception happens, I want the last input and the random state,
         # That way the bug can be recreated. Then we set the state to the way
         # it was before the exception, then cause the exception to happen again.
-        last_input = f"Last input: {dice_str}\n"
-        for key, value in dice_kwargs.items():
-            last_input += f" -    {key}: {value}\n"
-        rnd_state.save(state)
-        print("\nTraceback:")
-        traceback.print_tb(exc.__traceback__)
-        print()
-        print(last_input)
+        _report_failure(dice_str, dice_kwargs, _recreate_state(checkpoint),
+                        _format_exception(exc))
         return True
 
     if not suppress_print: print(f"roll: {roll}: {sum_}", end="\n\n")
-    return False
\ No newline at end of file
+    return False
+
+
+def _report_failure(dice_str: str, dice_kwargs: dict[str, int], state,
+                    traceback_lines: list[str]) -> None:
+    """
+    Pickle the random state from before a failed roll, and print the
+    traceback along with the input that caused it.
+    """
+    rnd_state.save(state)
+    print()
+    print("".join(traceback_lines))
+    print(_format_input("Last input", dice_str, dice_kwargs), end="\n\n")
+
+
+def _format_exception(exc: Exception) -> list[str]:
+    """
+    Format an exception's traceback, ending with the exception itself. The
+    whole stack is still walked, but only the innermost frames are kept and
+    formatted, since that's where the dice failed.
+    """
+    return list(traceback.TracebackException.from_exception(
+        exc, limit=-_TRACEBACK_LIMIT).format())
+
+
+def _format_input(label: str, dice_str: str, dice_kwargs: dict[str, int]) -> str:
+    """
+    Lay out a dice input for printing, with each key word argument on its
+    own line, joined in one go so it can be printed with a single call.
+    """
+    lines = [f"{label}: {dice_str}"]
+    lines.extend(f" -    {key}: {value}" for key, value in dice_kwargs.items())
+    return "\n".join(lines)
\ No newline at end of file